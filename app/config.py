@@ -1,60 +1,82 @@
+from functools import cached_property
 from pydantic_settings import BaseSettings
 
 
+# Known Datadog sites; intake hosts are derived from the site name.
+_KNOWN_SITES = (
+    "datadoghq.com",
+    "datadoghq.eu",
+    "us3.datadoghq.com",
+    "us5.datadoghq.com",
+    "ap1.datadoghq.com",
+    "ddog-gov.com",
+)
+
+_LOGS_URLS: dict[str, str] = {site: f"https://http-intake.logs.{site}" for site in _KNOWN_SITES}
+_EVENTS_URLS: dict[str, str] = {site: f"https://event-management-intake.{site}" for site in _KNOWN_SITES}
+
+
 class Settings(BaseSettings):
     dd_api_key: str = ""
     dd_site: str = "datadoghq.com"
     dd_agent_host: str = "127.0.0.1"
     dogstatsd_port: int = 8125
+    dogstatsd_max_packet_size: int = 1432
+    dd_dogstatsd_socket_path: str = ""
     max_requests_per_second: int = 10
     max_payload_size_mb: int = 5
     max_history_items: int = 100
+    max_history_body_bytes: int = 4096
+    dd_connect_timeout: float = 2.0
+    dd_request_timeout: float = 10.0
+    dd_max_retries: int = 3
+    dd_retry_base_delay: float = 1.0
+    dd_retry_max_delay: float = 30.0
+    dd_compress_min_bytes: int = 1024
     
-    @property
+    @cached_property
     def forwardog_log_path(self) -> str:
         return "/var/log/forwardog/forwardog.log"
     
-    @property
+    @cached_property
+    def dogstatsd_socket_path(self) -> str:
+        """Unix socket path for DogStatsD, from DD_DOGSTATSD_SOCKET_PATH or a unix:// agent host"""
+        if self.dd_dogstatsd_socket_path:
+            return self.dd_dogstatsd_socket_path
+        if self.dd_agent_host.startswith("unix://"):
+            return self.dd_agent_host[len("unix://"):]
+        return ""
+    
+    @cached_property
     def dd_api_url(self) -> str:
         return f"https://api.{self.dd_site}"
     
-    @property
+    @cached_property
     def dd_logs_url(self) -> str:
-        site_mapping = {
-            "datadoghq.com": "https://http-intake.logs.datadoghq.com",
-            "datadoghq.eu": "https://http-intake.logs.datadoghq.eu",
-            "us3.datadoghq.com": "https://http-intake.logs.us3.datadoghq.com",
-            "us5.datadoghq.com": "https://http-intake.logs.us5.datadoghq.com",
-            "ap1.datadoghq.com": "https://http-intake.logs.ap1.datadoghq.com",
-            "ddog-gov.com": "https://http-intake.logs.ddog-gov.com",
-        }
-        return site_mapping.get(self.dd_site, f"https://http-intake.logs.{self.dd_site}")
-    
-    @property
+        return _LOGS_URLS.get(self.dd_site) or f"https://http-intake.logs.{self.dd_site}"
+    
+    @cached_property
     def dd_events_url(self) -> str:
-        site_mapping = {
-            "datadoghq.com": "https://event-management-intake.datadoghq.com",
-            "datadoghq.eu": "https://event-management-intake.datadoghq.eu",
-            "us3.datadoghq.com": "https://event-management-intake.us3.datadoghq.com",
-            "us5.datadoghq.com": "https://event-management-intake.us5.datadoghq.com",
-            "ap1.datadoghq.com": "https://event-management-intake.ap1.datadoghq.com",
-            "ddog-gov.com": "https://event-management-intake.ddog-gov.com",
-        }
-        return site_mapping.get(self.dd_site, f"https://event-management-intake.{self.dd_site}")
-    
-    @property
-    def default_tags_list(self) -> list[str]:
-        return ["source:forwardog"]
+        return _EVENTS_URLS.get(self.dd_site) or f"https://event-management-intake.{self.dd_site}"
+    
+    @cached_property
+    def default_tags_list(self) -> tuple[str, ...]:
+        return ("source:forwardog",)
     
+    @cached_property
+    def default_tags_joined(self) -> str:
+        return ",".join(self.default_tags_list)
+    
+    @cached_property
     def is_configured(self) -> bool:
         return bool(self.dd_api_key)
     
-    def get_masked_api_key(self) -> str:
+    @cached_property
+    def masked_api_key(self) -> str:
         if not self.dd_api_key:
             return "(not configured)"
         if len(self.dd_api_key) <= 4:
             return "*" * len(self.dd_api_key)
         return "*" * (len(self.dd_api_key) - 4) + self.dd_api_key[-4:]
 
-
 settings = Settings()
@@ -1,98 +1,127 @@
+import importlib
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from pathlib import Path
-import httpx
 
 from app.config import settings
-from app.routers import metrics, logs, events, history
+
+# Routers (and the Datadog/DogStatsD services they pull in) are imported when
+# the app starts serving rather than when this module is imported.
+_ROUTER_MODULES = ("metrics", "logs", "events", "history")
+
+
+def _include_routers(app: FastAPI):
+    if getattr(app.state, "routers_included", False):
+        return
+    for name in _ROUTER_MODULES:
+        app.include_router(importlib.import_module(f"app.routers.{name}").router)
+    app.state.routers_included = True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    import httpx
+    
+    _include_routers(app)
+    app.state.http = httpx.AsyncClient(
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+    )
+    # Build the OpenAPI schema up front so the first /docs hit doesn't pay for it
+    app.openapi()
+    yield
+    await app.state.http.aclose()
+    
+    from app.services.datadog_client import datadog_client
+    await datadog_client.aclose()
+
 
 app = FastAPI(
     title="Forwardog",
     description="Datadog Metrics & Logs submission test tool",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 BASE_DIR = Path(__file__).resolve().parent
 app.mount("/static", StaticFiles(directory=BASE_DIR / "static"), name="static")
 templates = Jinja2Templates(directory=BASE_DIR / "templates")
 
-app.include_router(metrics.router)
-app.include_router(logs.router)
-app.include_router(events.router)
-app.include_router(history.router)
+
+# Settings are fixed for the lifetime of the process, so the config payloads
+# served by the UI endpoints are built once at import.
+_INDEX_CONFIG = {
+    "is_configured": settings.is_configured,
+    "masked_api_key": settings.masked_api_key,
+    "dd_site": settings.dd_site,
+    "dd_agent_host": settings.dd_agent_host,
+    "dogstatsd_port": settings.dogstatsd_port,
+    "log_path": settings.forwardog_log_path,
+}
+
+_CONFIG_JSON = {
+    **_INDEX_CONFIG,
+    "default_tags": settings.default_tags_list,
+    "max_requests_per_second": settings.max_requests_per_second,
+    "max_payload_size_mb": settings.max_payload_size_mb,
+}
+
+_HEALTH = {
+    "status": "healthy",
+    "configured": settings.is_configured,
+    "dd_site": settings.dd_site
+}
+
+
+# The index page only depends on settings, so it is rendered once as well.
+_INDEX_HTML = templates.get_template("index.html").render(config=_INDEX_CONFIG)
 
 
 @app.get("/", response_class=HTMLResponse)
-async def index(request: Request):
-    return templates.TemplateResponse(
-        "index.html",
-        {
-            "request": request,
-            "config": {
-                "is_configured": settings.is_configured(),
-                "masked_api_key": settings.get_masked_api_key(),
-                "dd_site": settings.dd_site,
-                "dd_agent_host": settings.dd_agent_host,
-                "dogstatsd_port": settings.dogstatsd_port,
-                "log_path": settings.forwardog_log_path,
-            }
-        }
-    )
+async def index():
+    return HTMLResponse(content=_INDEX_HTML)
 
 
 @app.get("/health")
 async def health():
-    return {
-        "status": "healthy",
-        "configured": settings.is_configured(),
-        "dd_site": settings.dd_site
-    }
+    return _HEALTH
 
 
 @app.get("/api/config")
 async def get_config():
-    return {
-        "is_configured": settings.is_configured(),
-        "masked_api_key": settings.get_masked_api_key(),
-        "dd_site": settings.dd_site,
-        "dd_agent_host": settings.dd_agent_host,
-        "dogstatsd_port": settings.dogstatsd_port,
-        "log_path": settings.forwardog_log_path,
-        "default_tags": settings.default_tags_list,
-        "max_requests_per_second": settings.max_requests_per_second,
-        "max_payload_size_mb": settings.max_payload_size_mb,
-    }
+    return _CONFIG_JSON
 
 
 @app.get("/api/validate-key")
-async def validate_api_key():
-    if not settings.is_configured():
+async def validate_api_key(request: Request):
+    if not settings.is_configured:
         return {
             "valid": False,
             "message": "API key not configured"
         }
     
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"https://api.{settings.dd_site}/api/v1/validate",
-                headers={
-                    "DD-API-KEY": settings.dd_api_key
-                }
-            )
-            
-            if response.status_code == 200:
-                return {
-                    "valid": True,
-                    "message": "API key is valid"
-                }
-            else:
-                return {
-                    "valid": False,
-                    "message": f"Invalid API key (HTTP {response.status_code})"
-                }
+        response = await request.app.state.http.get(
+            f"{settings.dd_api_url}/api/v1/validate",
+            headers={
+                "DD-API-KEY": settings.dd_api_key
+            }
+        )
+        
+        if response.status_code == 200:
+            return {
+                "valid": True,
+                "message": "API key is valid"
+            }
+        else:
+            return {
+                "valid": False,
+                "message": f"Invalid API key (HTTP {response.status_code})"
+            }
     except Exception as e:
         return {
             "valid": False,
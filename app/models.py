@@ -1,17 +1,17 @@
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum, StrEnum
 from typing import Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class MetricType(int, Enum):
+class MetricType(IntEnum):
     UNSPECIFIED = 0
     COUNT = 1
     RATE = 2
     GAUGE = 3
 
 
-class DogStatsDMetricType(str, Enum):
+class DogStatsDMetricType(StrEnum):
     COUNTER = "c"
     GAUGE = "g"
     HISTOGRAM = "h"
@@ -61,7 +61,7 @@ class DogStatsDRawRequest(BaseModel):
     line: str
 
 
-class LogStatus(str, Enum):
+class LogStatus(StrEnum):
     EMERGENCY = "emergency"
     ALERT = "alert"
     CRITICAL = "critical"
@@ -108,6 +108,8 @@ class AgentFileLogRequest(BaseModel):
 
 
 class SubmitResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     success: bool
     message: str
     request_id: Optional[str] = None
@@ -117,18 +119,18 @@ class SubmitResponse(BaseModel):
     error_hint: Optional[str] = None
 
 
-class EventCategory(str, Enum):
+class EventCategory(StrEnum):
     CHANGE = "change"
     ALERT = "alert"
 
 
-class EventAlertStatus(str, Enum):
+class EventAlertStatus(StrEnum):
     WARN = "warn"
     ERROR = "error"
     OK = "ok"
 
 
-class EventAlertPriority(str, Enum):
+class EventAlertPriority(StrEnum):
     P1 = "1"
     P2 = "2"
     P3 = "3"
@@ -136,12 +138,12 @@ class EventAlertPriority(str, Enum):
     P5 = "5"
 
 
-class EventChangeResourceType(str, Enum):
+class EventChangeResourceType(StrEnum):
     FEATURE_FLAG = "feature_flag"
     CONFIGURATION = "configuration"
 
 
-class EventAuthorType(str, Enum):
+class EventAuthorType(StrEnum):
     USER = "user"
     SYSTEM = "system"
     API = "api"
@@ -152,7 +154,7 @@ class EventsJsonRequest(BaseModel):
     payload: dict[str, Any]
 
 
-class HistoryEntryType(str, Enum):
+class HistoryEntryType(StrEnum):
     METRICS_API = "metrics_api"
     METRICS_DOGSTATSD = "metrics_dogstatsd"
     LOGS_API = "logs_api"
@@ -161,6 +163,8 @@ class HistoryEntryType(str, Enum):
 
 
 class HistoryEntry(BaseModel):
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
+    
     id: str
     type: HistoryEntryType
     timestamp: datetime
@@ -168,12 +172,14 @@ class HistoryEntry(BaseModel):
     response: SubmitResponse
     
 
-class PresetCategory(str, Enum):
+class PresetCategory(StrEnum):
     METRICS = "metrics"
     LOGS = "logs"
 
 
 class Preset(BaseModel):
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
+    
     id: str
     name: str
     description: str
@@ -0,0 +1,29 @@
+import hashlib
+from typing import Any
+import orjson
+from fastapi import Request, Response
+from pydantic import BaseModel
+from app.models import SubmitResponse
+
+
+# OpenAPI description for routes that return SubmitResponse via model_response
+SUBMIT_RESPONSES = {200: {"model": SubmitResponse}}
+
+
+class CachedJSON:
+    """JSON payload serialized once, served with an ETag so clients can revalidate"""
+
+    def __init__(self, content: Any):
+        self.body = orjson.dumps(content)
+        self.etag = f'"{hashlib.blake2b(self.body, digest_size=8).hexdigest()}"'
+
+    def response(self, request: Request) -> Response:
+        headers = {"ETag": self.etag}
+        if request.headers.get("if-none-match") == self.etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+def model_response(model: BaseModel) -> Response:
+    """Serialize a model straight to JSON with pydantic-core, omitting None fields"""
+    return Response(content=model.model_dump_json(exclude_none=True), media_type="application/json")
@@ -1,6 +1,5 @@
 from typing import Optional
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import PlainTextResponse
+from fastapi import APIRouter, HTTPException, Response
 from app.models import HistoryEntry, HistoryEntryType
 from app.services.history import history_service
 
@@ -34,10 +33,10 @@ async def clear_history():
     return {"message": "History cleared"}
 
 
-@router.get("/export/json", response_class=PlainTextResponse)
+@router.get("/export/json")
 async def export_history():
     """Export history as JSON"""
-    return PlainTextResponse(
+    return Response(
         content=history_service.export_json(),
         media_type="application/json"
     )
@@ -1,14 +1,16 @@
+import asyncio
 import time
 from typing import Any
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel
 from app.config import settings
+from app.responses import SUBMIT_RESPONSES, CachedJSON, model_response
 from app.models import (
     MetricsSubmitRequest,
     MetricsJsonRequest,
     DogStatsDRequest,
     DogStatsDRawRequest,
-    SubmitResponse,
     MetricType,
     DogStatsDMetricType,
     HistoryEntryType,
@@ -25,10 +27,10 @@ class CodeExecuteRequest(BaseModel):
 router = APIRouter(prefix="/api/metrics", tags=["metrics"])
 
 
-@router.post("/api/submit", response_model=SubmitResponse)
+@router.post("/api/submit", responses=SUBMIT_RESPONSES)
 async def submit_metrics_api(request: MetricsSubmitRequest):
     """Submit metrics via Datadog API v2"""
-    if not settings.is_configured():
+    if not settings.is_configured:
         raise HTTPException(status_code=400, detail="DD_API_KEY not configured")
     
     # Build payload
@@ -43,7 +45,7 @@ async def submit_metrics_api(request: MetricsSubmitRequest):
             "metric": series.metric,
             "type": series.type.value if series.type != MetricType.UNSPECIFIED else MetricType.GAUGE.value,
             "points": [],
-            "tags": series.tags + settings.default_tags_list,
+            "tags": [*series.tags, *settings.default_tags_list],
         }
         
         # Add resources
@@ -83,17 +85,17 @@ async def submit_metrics_api(request: MetricsSubmitRequest):
     # Save to history
     history_service.add(
         HistoryEntryType.METRICS_API,
-        {"series": [s.model_dump() for s in request.series]},
+        request.model_dump(),
         response
     )
     
-    return response
+    return model_response(response)
 
 
-@router.post("/api/submit-json", response_model=SubmitResponse)
+@router.post("/api/submit-json", responses=SUBMIT_RESPONSES)
 async def submit_metrics_json(request: MetricsJsonRequest):
     """Submit raw JSON payload to Datadog Metrics API"""
-    if not settings.is_configured():
+    if not settings.is_configured:
         raise HTTPException(status_code=400, detail="DD_API_KEY not configured")
     
     response = await datadog_client.submit_metrics(request.payload)
@@ -105,13 +107,13 @@ async def submit_metrics_json(request: MetricsJsonRequest):
         response
     )
     
-    return response
+    return model_response(response)
 
 
-@router.post("/dogstatsd/submit", response_model=SubmitResponse)
+@router.post("/dogstatsd/submit", responses=SUBMIT_RESPONSES)
 async def submit_dogstatsd(request: DogStatsDRequest):
     """Submit metric via DogStatsD"""
-    response = dogstatsd_client.send(
+    response = await dogstatsd_client.send_async(
         metric=request.metric,
         value=request.value,
         metric_type=request.metric_type,
@@ -127,13 +129,13 @@ async def submit_dogstatsd(request: DogStatsDRequest):
         response
     )
     
-    return response
+    return model_response(response)
 
 
-@router.post("/dogstatsd/submit-raw", response_model=SubmitResponse)
+@router.post("/dogstatsd/submit-raw", responses=SUBMIT_RESPONSES)
 async def submit_dogstatsd_raw(request: DogStatsDRawRequest):
     """Submit raw DogStatsD line"""
-    response = dogstatsd_client.send_raw(request.line)
+    response = await dogstatsd_client.send_raw_async(request.line)
     
     # Save to history
     history_service.add(
@@ -142,149 +144,174 @@ async def submit_dogstatsd_raw(request: DogStatsDRawRequest):
         response
     )
     
-    return response
+    return model_response(response)
 
 
-@router.post("/dogstatsd/execute", response_model=SubmitResponse)
+@router.post("/dogstatsd/execute", responses=SUBMIT_RESPONSES)
 async def execute_dogstatsd_code(request: CodeExecuteRequest):
     """Execute Python code with DogStatsD context"""
-    response = code_executor.execute(request.code)
+    # User code may block arbitrarily, so keep it off the event loop
+    response = await asyncio.to_thread(code_executor.execute, request.code)
     
-    # Save to history
+    # Save to history, keeping at most 500 bytes of the source
+    # surrogatepass: lone surrogates in the JSON body must not break the preview
+    code_bytes = request.code.encode("utf-8", "surrogatepass")
+    if len(code_bytes) > 500:
+        preview = code_bytes[:500].decode("utf-8", "ignore") + "..."
+    else:
+        preview = request.code
     history_service.add(
         HistoryEntryType.METRICS_DOGSTATSD,
-        {"code": request.code[:500] + "..." if len(request.code) > 500 else request.code},
+        {"code": preview},
         response
     )
     
-    return response
+    return model_response(response)
+
+
+# Examples and type listings only depend on settings, so they are
+# serialized once at import.
+_DOGSTATSD_EXAMPLES = CachedJSON({
+    "examples": [
+        {"id": key, "name": key.replace("_", " ").title(), "code": code}
+        for key, code in get_dogstatsd_examples().items()
+    ]
+})
+
+_METRIC_TYPES = CachedJSON({
+    "api_types": [t.value for t in MetricType],
+    "dogstatsd_types": [
+        {"value": t.value, "name": t.name} for t in DogStatsDMetricType
+    ]
+})
 
 
 @router.get("/dogstatsd/examples")
-async def get_dogstatsd_examples_endpoint():
+async def get_dogstatsd_examples_endpoint(request: Request):
     """Get DogStatsD Python code examples"""
-    examples = get_dogstatsd_examples()
-    return {
-        "examples": [
-            {"id": key, "name": key.replace("_", " ").title(), "code": code}
-            for key, code in examples.items()
-        ]
-    }
+    return _DOGSTATSD_EXAMPLES.response(request)
+
+
+@router.get("/dogstatsd/stats")
+async def get_dogstatsd_stats():
+    """Get DogStatsD client counters (sends dropped on a full socket buffer)"""
+    return dogstatsd_client.stats()
 
 
 @router.get("/types")
-async def get_metric_types():
+async def get_metric_types(request: Request):
     """Get available metric types"""
-    return {
-        "api_types": [t.value for t in MetricType],
-        "dogstatsd_types": [
-            {"value": t.value, "name": t.name} for t in DogStatsDMetricType
-        ]
-    }
+    return _METRIC_TYPES.response(request)
 
 
-@router.get("/presets")
-async def get_metrics_presets():
-    """Get metric presets/templates"""
-    current_time = int(time.time())
-    
-    return {
-        "api_presets": [
-            {
-                "name": "Simple Gauge",
-                "description": "Basic gauge metric",
-                "payload": {
-                    "series": [{
-                        "metric": "forwardog.api.gauge",
+# Presets carry the current time, so only the "__TS__" placeholder is
+# substituted per request.
+_METRICS_PRESETS_TEMPLATE = orjson.dumps({
+    "api_presets": [
+        {
+            "name": "Simple Gauge",
+            "description": "Basic gauge metric",
+            "payload": {
+                "series": [{
+                    "metric": "forwardog.api.gauge",
+                    "type": 3,
+                    "points": [{"timestamp": "__TS__", "value": 42}],
+                    "resources": [{"name": "forwardog-test", "type": "host"}],
+                    "tags": ["env:test", "source:forwardog"]
+                }]
+            }
+        },
+        {
+            "name": "Counter with Interval",
+            "description": "Counter metric with interval",
+            "payload": {
+                "series": [{
+                    "metric": "forwardog.api.counter",
+                    "type": 1,
+                    "interval": 10,
+                    "points": [{"timestamp": "__TS__", "value": 100}],
+                    "resources": [{"name": "forwardog-test", "type": "host"}],
+                    "tags": ["env:test", "source:forwardog"]
+                }]
+            }
+        },
+        {
+            "name": "Rate Metric",
+            "description": "Rate metric example",
+            "payload": {
+                "series": [{
+                    "metric": "forwardog.api.rate",
+                    "type": 2,
+                    "interval": 10,
+                    "points": [{"timestamp": "__TS__", "value": 5.5}],
+                    "resources": [{"name": "forwardog-test", "type": "host"}],
+                    "tags": ["env:test", "source:forwardog"]
+                }]
+            }
+        },
+        {
+            "name": "Multiple Series",
+            "description": "Multiple metrics in one request",
+            "payload": {
+                "series": [
+                    {
+                        "metric": "forwardog.api.cpu",
                         "type": 3,
-                        "points": [{"timestamp": current_time, "value": 42}],
+                        "points": [{"timestamp": "__TS__", "value": 65.5}],
                         "resources": [{"name": "forwardog-test", "type": "host"}],
-                        "tags": ["env:test", "source:forwardog"]
-                    }]
-                }
-            },
-            {
-                "name": "Counter with Interval",
-                "description": "Counter metric with interval",
-                "payload": {
-                    "series": [{
-                        "metric": "forwardog.api.counter",
-                        "type": 1,
-                        "interval": 10,
-                        "points": [{"timestamp": current_time, "value": 100}],
-                        "resources": [{"name": "forwardog-test", "type": "host"}],
-                        "tags": ["env:test", "source:forwardog"]
-                    }]
-                }
-            },
-            {
-                "name": "Rate Metric",
-                "description": "Rate metric example",
-                "payload": {
-                    "series": [{
-                        "metric": "forwardog.api.rate",
-                        "type": 2,
-                        "interval": 10,
-                        "points": [{"timestamp": current_time, "value": 5.5}],
+                        "tags": ["env:test"]
+                    },
+                    {
+                        "metric": "forwardog.api.memory",
+                        "type": 3,
+                        "points": [{"timestamp": "__TS__", "value": 78.2}],
                         "resources": [{"name": "forwardog-test", "type": "host"}],
-                        "tags": ["env:test", "source:forwardog"]
-                    }]
-                }
-            },
-            {
-                "name": "Multiple Series",
-                "description": "Multiple metrics in one request",
-                "payload": {
-                    "series": [
-                        {
-                            "metric": "forwardog.api.cpu",
-                            "type": 3,
-                            "points": [{"timestamp": current_time, "value": 65.5}],
-                            "resources": [{"name": "forwardog-test", "type": "host"}],
-                            "tags": ["env:test"]
-                        },
-                        {
-                            "metric": "forwardog.api.memory",
-                            "type": 3,
-                            "points": [{"timestamp": current_time, "value": 78.2}],
-                            "resources": [{"name": "forwardog-test", "type": "host"}],
-                            "tags": ["env:test"]
-                        }
-                    ]
-                }
+                        "tags": ["env:test"]
+                    }
+                ]
             }
-        ],
-        "dogstatsd_presets": [
-            {
-                "name": "Gauge",
-                "description": "Simple gauge metric",
-                "line": "forwardog.test.gauge:42|g|#env:test,source:forwardog"
-            },
-            {
-                "name": "Counter",
-                "description": "Increment counter",
-                "line": "forwardog.test.counter:1|c|#env:test,source:forwardog"
-            },
-            {
-                "name": "Histogram",
-                "description": "Histogram/Timer",
-                "line": "forwardog.test.histogram:125|h|#env:test,source:forwardog"
-            },
-            {
-                "name": "Distribution",
-                "description": "Distribution metric",
-                "line": "forwardog.test.distribution:50|d|#env:test,source:forwardog"
-            },
-            {
-                "name": "Set",
-                "description": "Unique value set",
-                "line": "forwardog.test.set:user123|s|#env:test,source:forwardog"
-            },
-            {
-                "name": "Counter with Sample Rate",
-                "description": "Counter with 50% sample rate",
-                "line": "forwardog.test.sampled:1|c|@0.5|#env:test,source:forwardog"
-            }
-        ]
-    }
+        }
+    ],
+    "dogstatsd_presets": [
+        {
+            "name": "Gauge",
+            "description": "Simple gauge metric",
+            "line": "forwardog.test.gauge:42|g|#env:test,source:forwardog"
+        },
+        {
+            "name": "Counter",
+            "description": "Increment counter",
+            "line": "forwardog.test.counter:1|c|#env:test,source:forwardog"
+        },
+        {
+            "name": "Histogram",
+            "description": "Histogram/Timer",
+            "line": "forwardog.test.histogram:125|h|#env:test,source:forwardog"
+        },
+        {
+            "name": "Distribution",
+            "description": "Distribution metric",
+            "line": "forwardog.test.distribution:50|d|#env:test,source:forwardog"
+        },
+        {
+            "name": "Set",
+            "description": "Unique value set",
+            "line": "forwardog.test.set:user123|s|#env:test,source:forwardog"
+        },
+        {
+            "name": "Counter with Sample Rate",
+            "description": "Counter with 50% sample rate",
+            "line": "forwardog.test.sampled:1|c|@0.5|#env:test,source:forwardog"
+        }
+    ]
+})
+
 
+@router.get("/presets")
+async def get_metrics_presets():
+    """Get metric presets/templates"""
+    current_time = int(time.time())
+    return Response(
+        content=_METRICS_PRESETS_TEMPLATE.replace(b'"__TS__"', str(current_time).encode()),
+        media_type="application/json"
+    )
@@ -1,54 +1,121 @@
+import secrets
 import sys
+import threading
 import time
 import io
 import traceback
 from contextlib import redirect_stdout, redirect_stderr
-from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, Optional
 
 from datadog import initialize, statsd
 from app.config import settings
 from app.models import SubmitResponse
 
 
+# Sources longer than this are compiled directly rather than kept in the cache
+_MAX_CACHED_SOURCE = 4096
+
+# Number of innermost frames kept in error tracebacks
+_TRACEBACK_LIMIT = 20
+
+# Cap on captured stdout/stderr per execution
+_MAX_CAPTURED_OUTPUT = 64 * 1024
+
+
+class BoundedWriter(io.TextIOBase):
+    """Text sink that keeps at most `cap` characters and drops the rest"""
+    
+    def __init__(self, cap: int = _MAX_CAPTURED_OUTPUT):
+        self._chunks: list[str] = []
+        self._size = 0
+        self._cap = cap
+        self._truncated = False
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, s: str) -> int:
+        remaining = self._cap - self._size
+        if remaining <= 0:
+            self._truncated = self._truncated or bool(s)
+            return len(s)
+        if len(s) > remaining:
+            self._truncated = True
+            self._chunks.append(s[:remaining])
+            self._size = self._cap
+        else:
+            self._chunks.append(s)
+            self._size += len(s)
+        return len(s)
+    
+    def getvalue(self) -> str:
+        value = "".join(self._chunks)
+        if self._truncated:
+            value += "\n...[truncated]"
+        return value
+
+
+@lru_cache(maxsize=256)
+def _compile(code: str):
+    """Compile user code, memoized so repeated example runs skip the parser"""
+    return compile(code, "<dogstatsd-exec>", "exec")
+
+
 class CodeExecutor:
     def __init__(self):
         self._initialized = False
+        # stdout/stderr redirection is process-wide, so executions are serialized
+        self._lock = threading.Lock()
+        # Copied per execution so user code cannot leak names into later runs
+        self._base_globals = {
+            '__builtins__': __builtins__,
+            'statsd': statsd,
+            'time': time,
+            'print': print,
+        }
     
     def _ensure_initialized(self):
         """Initialize DogStatsD client"""
         if not self._initialized:
-            initialize(
-                statsd_host=settings.dd_agent_host,
-                statsd_port=settings.dogstatsd_port,
-            )
+            if settings.dogstatsd_socket_path:
+                initialize(statsd_socket_path=settings.dogstatsd_socket_path)
+            else:
+                initialize(
+                    statsd_host=settings.dd_agent_host,
+                    statsd_port=settings.dogstatsd_port,
+                )
             self._initialized = True
     
     def execute(self, code: str) -> SubmitResponse:
         """Execute Python code and return result"""
-        start_time = time.time()
-        request_id = f"dogstatsd-exec-{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        with self._lock:
+            return self._execute(code)
+    
+    def _execute(self, code: str) -> SubmitResponse:
+        start_time = time.monotonic_ns()
+        request_id = f"dogstatsd-exec-{time.time_ns():x}-{secrets.token_hex(3)}"
         
-        self._ensure_initialized()
+        if not self._initialized:
+            self._ensure_initialized()
         
-        stdout_capture = io.StringIO()
-        stderr_capture = io.StringIO()
+        stdout_capture = BoundedWriter()
+        stderr_capture = BoundedWriter()
         
-        exec_globals = {
-            '__builtins__': __builtins__,
-            'statsd': statsd,
-            'time': time,
-            'print': print,
-        }
+        exec_globals = self._base_globals.copy()
         
         try:
             with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-                exec(code, exec_globals)
+                if len(code) <= _MAX_CACHED_SOURCE:
+                    code_obj = _compile(code)
+                else:
+                    code_obj = compile(code, "<dogstatsd-exec>", "exec")
+                exec(code_obj, exec_globals)
             
             stdout_output = stdout_capture.getvalue()
             stderr_output = stderr_capture.getvalue()
             
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.monotonic_ns() - start_time) / 1e6
             
             output_lines = []
             if stdout_output:
@@ -69,11 +136,12 @@ class CodeExecutor:
             )
             
         except SyntaxError as e:
+            latency_ms = (time.monotonic_ns() - start_time) / 1e6
             return SubmitResponse(
                 success=False,
                 message=f"Syntax Error: {e.msg}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=latency_ms,
                 response_body={
                     "error": str(e),
                     "line": e.lineno,
@@ -81,12 +149,15 @@ class CodeExecutor:
                 error_hint=f"Check syntax at line {e.lineno}"
             )
         except Exception as e:
-            tb = traceback.format_exc()
+            latency_ms = (time.monotonic_ns() - start_time) / 1e6
+            tb = "".join(traceback.format_exception(
+                type(e), e, e.__traceback__, limit=-_TRACEBACK_LIMIT, chain=False
+            ))
             return SubmitResponse(
                 success=False,
                 message=f"Error: {type(e).__name__}: {str(e)}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=latency_ms,
                 response_body={
                     "error": str(e),
                     "traceback": tb,
@@ -98,18 +169,23 @@ class CodeExecutor:
 code_executor = CodeExecutor()
 
 
-def get_dogstatsd_examples():
-    """Get DogStatsD examples with dynamic host/port from settings"""
-    host = settings.dd_agent_host
-    port = settings.dogstatsd_port
+@lru_cache(maxsize=4)
+def get_dogstatsd_examples(host: Optional[str] = None, port: Optional[int] = None) -> dict[str, str]:
+    """Get DogStatsD examples, defaulting host/port to settings (memoized per host/port)"""
+    if host is None and port is None and settings.dogstatsd_socket_path:
+        # Same transport the executor initializes, so running an example keeps it
+        options = f"    'statsd_socket_path': '{settings.dogstatsd_socket_path}'"
+    else:
+        host = host or settings.dd_agent_host
+        port = port or settings.dogstatsd_port
+        options = f"    'statsd_host': '{host}',\n    'statsd_port': {port}"
     
     return {
         "gauge": f'''from datadog import initialize, statsd
 
 # Initialize DogStatsD client
 options = {{
-    'statsd_host': '{host}',
-    'statsd_port': {port}
+{options}
 }}
 initialize(**options)
 
@@ -121,8 +197,7 @@ statsd.gauge('forwardog.dogstatsd.gauge', 42, tags=['env:test', 'source:forwardo
 
 # Initialize DogStatsD client
 options = {{
-    'statsd_host': '{host}',
-    'statsd_port': {port}
+{options}
 }}
 initialize(**options)
 
@@ -139,8 +214,7 @@ import random
 
 # Initialize DogStatsD client
 options = {{
-    'statsd_host': '{host}',
-    'statsd_port': {port}
+{options}
 }}
 initialize(**options)
 
@@ -156,8 +230,7 @@ import random
 
 # Initialize DogStatsD client
 options = {{
-    'statsd_host': '{host}',
-    'statsd_port': {port}
+{options}
 }}
 initialize(**options)
 
@@ -172,8 +245,7 @@ for i in range(10):
 
 # Initialize DogStatsD client
 options = {{
-    'statsd_host': '{host}',
-    'statsd_port': {port}
+{options}
 }}
 initialize(**options)
 
@@ -189,8 +261,7 @@ import time
 
 # Initialize DogStatsD client
 options = {{
-    'statsd_host': '{host}',
-    'statsd_port': {port}
+{options}
 }}
 initialize(**options)
 
@@ -208,8 +279,7 @@ import time
 
 # Initialize DogStatsD client
 options = {{
-    'statsd_host': '{host}',
-    'statsd_port': {port}
+{options}
 }}
 initialize(**options)
 
@@ -228,8 +298,7 @@ import random
 
 # Initialize DogStatsD client
 options = {{
-    'statsd_host': '{host}',
-    'statsd_port': {port}
+{options}
 }}
 initialize(**options)
 
@@ -250,8 +319,7 @@ print("Sent multiple system and application metrics")
 
 # Initialize DogStatsD client
 options = {{
-    'statsd_host': '{host}',
-    'statsd_port': {port}
+{options}
 }}
 initialize(**options)
 
@@ -270,8 +338,7 @@ print("Sent service check: OK")
 
 # Initialize DogStatsD client
 options = {{
-    'statsd_host': '{host}',
-    'statsd_port': {port}
+{options}
 }}
 initialize(**options)
 
@@ -1,11 +1,17 @@
 import time
-import json
 import gzip
+import random
+import asyncio
 from typing import Any, Optional
-from datetime import datetime
 import httpx
+import orjson
 from app.config import settings
 from app.models import SubmitResponse
+from app.services.encoding import dumps
+
+
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_JITTER = 0.5
 
 
 class DatadogClient:
@@ -13,13 +19,93 @@ class DatadogClient:
         self.api_url = settings.dd_api_url
         self.logs_url = settings.dd_logs_url
         self.events_url = settings.dd_events_url
+        self._series_url = f"{self.api_url}/api/v2/series"
+        self._logs_intake_url = f"{self.logs_url}/api/v2/logs"
+        self._events_v1_url = f"{self.api_url}/api/v1/events"
+        self._events_v2_url = f"{self.events_url}/api/v2/events"
         self.api_key = settings.dd_api_key
+        # Shared, never mutated: httpx merges them into a fresh Headers per request
+        self._json_headers = {"DD-API-KEY": self.api_key, "Content-Type": "application/json"}
+        self._gzip_headers = {**self._json_headers, "Content-Encoding": "gzip"}
+        # A dead endpoint fails on connect within seconds and is handed to the retry loop
+        self._timeout = httpx.Timeout(settings.dd_request_timeout, connect=settings.dd_connect_timeout)
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared client so submissions reuse pooled keep-alive connections"""
+        if self._client is None:
+            # HTTP/2 multiplexes concurrent submissions over one connection per intake host
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self._timeout,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+            )
+        return self._client
+    
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def __aenter__(self) -> "DatadogClient":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
         
-    def _get_headers(self, content_type: str = "application/json") -> dict[str, str]:
-        return {
-            "DD-API-KEY": self.api_key,
-            "Content-Type": content_type,
-        }
+    def _encode_body(self, payload: Any, compress: bool) -> tuple[bytes, dict[str, str]]:
+        """Serialize payload, gzipping it when forced or above dd_compress_min_bytes"""
+        body = dumps(payload)
+        min_bytes = settings.dd_compress_min_bytes
+        if compress or (min_bytes > 0 and len(body) >= min_bytes):
+            return gzip.compress(body, compresslevel=6), self._gzip_headers
+        return body, self._json_headers
+    
+    def _parse_body(self, response: httpx.Response) -> Any:
+        """Decode the response body, only invoking the JSON parser on JSON content"""
+        if not response.content:
+            return None
+        if "json" in response.headers.get("content-type", ""):
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                pass
+        return response.text
+    
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Exponential backoff with jitter, preferring the server's Retry-After"""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(settings.dd_retry_max_delay, max(0.0, float(retry_after)))
+                except ValueError:
+                    pass
+        delay = min(settings.dd_retry_max_delay, settings.dd_retry_base_delay * 2 ** attempt)
+        return delay * (1 + random.uniform(-_RETRY_JITTER, _RETRY_JITTER))
+    
+    async def _post_with_retry(
+        self,
+        url: str,
+        body: bytes,
+        headers: dict[str, str],
+        params: Optional[dict[str, str]] = None
+    ) -> httpx.Response:
+        """POST, retrying rate limits, 5xx and transport errors; other statuses return immediately"""
+        client = self._get_client()
+        attempt = 0
+        while True:
+            try:
+                response = await client.post(url, content=body, headers=headers, params=params)
+            except httpx.TransportError:
+                if attempt >= settings.dd_max_retries:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt))
+            else:
+                if response.status_code not in _RETRYABLE_STATUSES or attempt >= settings.dd_max_retries:
+                    return response
+                await asyncio.sleep(self._retry_delay(attempt, response))
+            attempt += 1
     
     def _get_error_hint(self, status_code: int, response_body: Any) -> Optional[str]:
         hints = {
@@ -36,32 +122,19 @@ class DatadogClient:
         return hints.get(status_code)
     
     async def submit_metrics(self, payload: dict[str, Any], compress: bool = False) -> SubmitResponse:
-        url = f"{self.api_url}/api/v2/series"
-        headers = self._get_headers()
+        url = self._series_url
         
-        start_time = time.time()
-        request_id = f"metrics-{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        start_time = time.monotonic_ns()
+        request_id = f"metrics-{time.time_ns():x}"
         
         try:
-            body = json.dumps(payload).encode()
-            if compress:
-                headers["Content-Encoding"] = "gzip"
-                body = gzip.compress(body)
+            body, headers = self._encode_body(payload, compress)
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    content=body,
-                    headers=headers,
-                    timeout=30.0
-                )
+            response = await self._post_with_retry(url, body, headers)
             
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.monotonic_ns() - start_time) / 1e6
             
-            try:
-                response_body = response.json()
-            except Exception:
-                response_body = response.text
+            response_body = self._parse_body(response)
             
             if response.status_code in (200, 202):
                 return SubmitResponse(
@@ -88,7 +161,7 @@ class DatadogClient:
                 success=False,
                 message="Request timeout",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint="Request timed out. Check network connectivity to Datadog."
             )
         except Exception as e:
@@ -96,7 +169,7 @@ class DatadogClient:
                 success=False,
                 message=f"Error: {str(e)}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint=f"Unexpected error: {type(e).__name__}"
             )
     
@@ -106,35 +179,20 @@ class DatadogClient:
         ddtags: Optional[str] = None,
         compress: bool = False
     ) -> SubmitResponse:
-        url = f"{self.logs_url}/api/v2/logs"
-        headers = self._get_headers()
-        
-        if ddtags:
-            url = f"{url}?ddtags={ddtags}"
+        url = self._logs_intake_url
+        params = {"ddtags": ddtags} if ddtags else None
         
-        start_time = time.time()
-        request_id = f"logs-{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        start_time = time.monotonic_ns()
+        request_id = f"logs-{time.time_ns():x}"
         
         try:
-            body = json.dumps(logs).encode()
-            if compress:
-                headers["Content-Encoding"] = "gzip"
-                body = gzip.compress(body)
+            body, headers = self._encode_body(logs, compress)
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    content=body,
-                    headers=headers,
-                    timeout=30.0
-                )
+            response = await self._post_with_retry(url, body, headers, params)
             
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.monotonic_ns() - start_time) / 1e6
             
-            try:
-                response_body = response.json()
-            except Exception:
-                response_body = response.text
+            response_body = self._parse_body(response)
             
             if response.status_code in (200, 202):
                 return SubmitResponse(
@@ -161,7 +219,7 @@ class DatadogClient:
                 success=False,
                 message="Request timeout",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint="Request timed out. Check network connectivity to Datadog."
             )
         except Exception as e:
@@ -169,7 +227,7 @@ class DatadogClient:
                 success=False,
                 message=f"Error: {str(e)}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint=f"Unexpected error: {type(e).__name__}"
             )
 
@@ -183,29 +241,19 @@ class DatadogClient:
         - priority (normal/low)
         - host, tags, alert_type, aggregation_key, etc.
         """
-        url = f"{self.api_url}/api/v1/events"
-        headers = self._get_headers()
+        url = self._events_v1_url
         
-        start_time = time.time()
-        request_id = f"event-v1-{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        start_time = time.monotonic_ns()
+        request_id = f"event-v1-{time.time_ns():x}"
         
         try:
-            body = json.dumps(event).encode()
+            body = dumps(event)
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    content=body,
-                    headers=headers,
-                    timeout=30.0
-                )
+            response = await self._post_with_retry(url, body, self._json_headers)
             
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.monotonic_ns() - start_time) / 1e6
             
-            try:
-                response_body = response.json()
-            except Exception:
-                response_body = response.text
+            response_body = self._parse_body(response)
             
             if response.status_code in (200, 201, 202):
                 return SubmitResponse(
@@ -232,7 +280,7 @@ class DatadogClient:
                 success=False,
                 message="Request timeout",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint="Request timed out. Check network connectivity to Datadog."
             )
         except Exception as e:
@@ -240,7 +288,7 @@ class DatadogClient:
                 success=False,
                 message=f"Error: {str(e)}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint=f"Unexpected error: {type(e).__name__}"
             )
 
@@ -264,29 +312,19 @@ class DatadogClient:
             }
         }
         """
-        url = f"{self.events_url}/api/v2/events"
-        headers = self._get_headers()
+        url = self._events_v2_url
         
-        start_time = time.time()
-        request_id = f"event-{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        start_time = time.monotonic_ns()
+        request_id = f"event-{time.time_ns():x}"
         
         try:
-            body = json.dumps(event).encode()
+            body = dumps(event)
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    content=body,
-                    headers=headers,
-                    timeout=30.0
-                )
+            response = await self._post_with_retry(url, body, self._json_headers)
             
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.monotonic_ns() - start_time) / 1e6
             
-            try:
-                response_body = response.json()
-            except Exception:
-                response_body = response.text
+            response_body = self._parse_body(response)
             
             if response.status_code in (200, 201, 202):
                 return SubmitResponse(
@@ -313,7 +351,7 @@ class DatadogClient:
                 success=False,
                 message="Request timeout",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint="Request timed out. Check network connectivity to Datadog."
             )
         except Exception as e:
@@ -321,7 +359,7 @@ class DatadogClient:
                 success=False,
                 message=f"Error: {str(e)}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint=f"Unexpected error: {type(e).__name__}"
             )
 
@@ -1,23 +1,81 @@
+import asyncio
 import socket
+import threading
 import time
-from datetime import datetime
 from typing import Optional
 from app.config import settings
 from app.models import DogStatsDMetricType, SubmitResponse
 
 
+_SNDBUF_SIZE = 8 * 1024 * 1024
+
+
 class DogStatsDClient:
     def __init__(self):
         self.host = settings.dd_agent_host
         self.port = settings.dogstatsd_port
         self._socket: Optional[socket.socket] = None
+        self._addr: Optional[tuple[str, int]] = None
+        self._socket_path = settings.dogstatsd_socket_path
+        if self._socket_path:
+            self._endpoint = f"unix://{self._socket_path}"
+            self._target_info = {"socket_path": self._socket_path}
+            self._config_hint = "Check DD_DOGSTATSD_SOCKET_PATH (or the unix:// DD_AGENT_HOST)."
+        else:
+            self._endpoint = f"{self.host}:{self.port}"
+            self._target_info = {"host": self.host, "port": self.port}
+            self._config_hint = "Check DD_AGENT_HOST and DOGSTATSD_PORT."
+        self._max_packet_size = settings.dogstatsd_max_packet_size or 1432
+        self._dropped = 0
+        self._local = threading.local()
+    
+    def _packet_buffer(self) -> bytearray:
+        """Per-thread scratch buffer sized to one datagram, reused across batches"""
+        buf = getattr(self._local, "buf", None)
+        if buf is None or len(buf) != self._max_packet_size:
+            buf = self._local.buf = bytearray(self._max_packet_size)
+        return buf
     
     def _get_socket(self) -> socket.socket:
         if self._socket is None:
-            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            family = socket.AF_UNIX if self._socket_path else socket.AF_INET
+            self._socket = socket.socket(family, socket.SOCK_DGRAM)
             self._socket.setblocking(False)
+            try:
+                # A larger send buffer absorbs bursts before sends start failing with EAGAIN
+                self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SNDBUF_SIZE)
+            except OSError:
+                pass
         return self._socket
     
+    def _target(self):
+        """Destination for sync sends: the Unix socket path or the agent's UDP address"""
+        return self._socket_path or self._addr or (self.host, self.port)
+    
+    async def _resolve_addr(self):
+        """Resolve the agent address without blocking the event loop"""
+        if self._socket_path:
+            return self._socket_path
+        if self._addr is None:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                self.host, self.port, family=socket.AF_INET, type=socket.SOCK_DGRAM
+            )
+            self._addr = infos[0][4]
+        return self._addr
+    
+    def stats(self) -> dict[str, int]:
+        return {"dropped": self._dropped}
+    
+    def _dropped_response(self, request_id: str, start_time: int) -> SubmitResponse:
+        self._dropped += 1
+        return SubmitResponse(
+            success=False,
+            message="Dropped: socket send buffer full",
+            request_id=request_id,
+            latency_ms=(time.monotonic_ns() - start_time) / 1e6,
+            error_hint="The kernel socket send buffer is full. The Datadog Agent may not be keeping up."
+        )
+    
     def _format_metric(
         self,
         metric: str,
@@ -30,14 +88,19 @@ class DogStatsDClient:
         if namespace:
             metric = f"{namespace}.{metric}"
         
-        line = f"{metric}:{value}|{metric_type.value}"
+        # StrEnum formats as its wire token, so no .value lookup is needed
+        line = f"{metric}:{value}|{metric_type}"
         
         if sample_rate < 1.0:
             line += f"|@{sample_rate}"
         
-        all_tags = settings.default_tags_list + tags
-        if all_tags:
-            line += f"|#{','.join(all_tags)}"
+        # Default tags are pre-joined once in settings; only request tags are joined here
+        default_tags = settings.default_tags_joined
+        if tags:
+            joined = ",".join(tags)
+            line += f"|#{default_tags},{joined}" if default_tags else f"|#{joined}"
+        elif default_tags:
+            line += f"|#{default_tags}"
         
         return line
     
@@ -53,110 +116,219 @@ class DogStatsDClient:
         if tags is None:
             tags = []
             
-        start_time = time.time()
-        request_id = f"dogstatsd-{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        start_time = time.monotonic_ns()
+        request_id = f"dogstatsd-{time.time_ns():x}"
         
         line = self._format_metric(metric, value, metric_type, tags, sample_rate, namespace)
         
         try:
             sock = self._get_socket()
-            sock.sendto(line.encode('utf-8'), (self.host, self.port))
+            sock.sendto(line.encode('utf-8'), self._target())
             
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.monotonic_ns() - start_time) / 1e6
             
             return SubmitResponse(
                 success=True,
                 message=f"Metric sent via DogStatsD",
                 request_id=request_id,
                 latency_ms=latency_ms,
-                response_body={"line": line, "host": self.host, "port": self.port}
+                response_body={"line": line, **self._target_info}
             )
             
+        except BlockingIOError:
+            return self._dropped_response(request_id, start_time)
         except socket.error as e:
             return SubmitResponse(
                 success=False,
                 message=f"Socket error: {str(e)}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
-                error_hint=f"Failed to send UDP packet to {self.host}:{self.port}. Check DD_AGENT_HOST and DOGSTATSD_PORT."
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
+                error_hint=f"Failed to send DogStatsD packet to {self._endpoint}. {self._config_hint}"
             )
         except Exception as e:
             return SubmitResponse(
                 success=False,
                 message=f"Error: {str(e)}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint=f"Unexpected error: {type(e).__name__}"
             )
     
     def send_raw(self, line: str) -> SubmitResponse:
-        start_time = time.time()
-        request_id = f"dogstatsd-raw-{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        start_time = time.monotonic_ns()
+        request_id = f"dogstatsd-raw-{time.time_ns():x}"
         
         try:
             sock = self._get_socket()
-            sock.sendto(line.encode('utf-8'), (self.host, self.port))
+            sock.sendto(line.encode('utf-8'), self._target())
             
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.monotonic_ns() - start_time) / 1e6
             
             return SubmitResponse(
                 success=True,
                 message="Raw line sent via DogStatsD",
                 request_id=request_id,
                 latency_ms=latency_ms,
-                response_body={"line": line, "host": self.host, "port": self.port}
+                response_body={"line": line, **self._target_info}
             )
             
+        except BlockingIOError:
+            return self._dropped_response(request_id, start_time)
         except socket.error as e:
             return SubmitResponse(
                 success=False,
                 message=f"Socket error: {str(e)}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
-                error_hint=f"Failed to send UDP packet to {self.host}:{self.port}. Check DD_AGENT_HOST and DOGSTATSD_PORT."
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
+                error_hint=f"Failed to send DogStatsD packet to {self._endpoint}. {self._config_hint}"
             )
         except Exception as e:
             return SubmitResponse(
                 success=False,
                 message=f"Error: {str(e)}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
+                error_hint=f"Unexpected error: {type(e).__name__}"
+            )
+    
+    async def send_async(
+        self,
+        metric: str,
+        value: float,
+        metric_type: DogStatsDMetricType = DogStatsDMetricType.GAUGE,
+        tags: list[str] = None,
+        sample_rate: float = 1.0,
+        namespace: Optional[str] = None
+    ) -> SubmitResponse:
+        """Event-loop friendly variant of send()"""
+        if tags is None:
+            tags = []
+            
+        start_time = time.monotonic_ns()
+        request_id = f"dogstatsd-{time.time_ns():x}"
+        
+        line = self._format_metric(metric, value, metric_type, tags, sample_rate, namespace)
+        return await self._send_line_async(line, "Metric sent via DogStatsD", request_id, start_time)
+    
+    async def send_raw_async(self, line: str) -> SubmitResponse:
+        """Event-loop friendly variant of send_raw()"""
+        start_time = time.monotonic_ns()
+        request_id = f"dogstatsd-raw-{time.time_ns():x}"
+        
+        return await self._send_line_async(line, "Raw line sent via DogStatsD", request_id, start_time)
+    
+    async def _send_line_async(
+        self,
+        line: str,
+        message: str,
+        request_id: str,
+        start_time: int
+    ) -> SubmitResponse:
+        try:
+            sock = self._get_socket()
+            addr = await self._resolve_addr()
+            # Send directly on the non-blocking socket: a full buffer is a drop,
+            # never a wait (loop.sock_sendto would park until it is writable)
+            sock.sendto(line.encode('utf-8'), addr)
+            
+            latency_ms = (time.monotonic_ns() - start_time) / 1e6
+            
+            return SubmitResponse(
+                success=True,
+                message=message,
+                request_id=request_id,
+                latency_ms=latency_ms,
+                response_body={"line": line, **self._target_info}
+            )
+            
+        except BlockingIOError:
+            return self._dropped_response(request_id, start_time)
+        except socket.error as e:
+            # Re-resolve on the next send in case the agent address changed
+            self._addr = None
+            return SubmitResponse(
+                success=False,
+                message=f"Socket error: {str(e)}",
+                request_id=request_id,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
+                error_hint=f"Failed to send DogStatsD packet to {self._endpoint}. {self._config_hint}"
+            )
+        except Exception as e:
+            return SubmitResponse(
+                success=False,
+                message=f"Error: {str(e)}",
+                request_id=request_id,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint=f"Unexpected error: {type(e).__name__}"
             )
     
     def send_batch(self, lines: list[str]) -> SubmitResponse:
-        start_time = time.time()
-        request_id = f"dogstatsd-batch-{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        start_time = time.monotonic_ns()
+        request_id = f"dogstatsd-batch-{time.time_ns():x}"
         
         try:
             sock = self._get_socket()
-            payload = '\n'.join(lines)
-            sock.sendto(payload.encode('utf-8'), (self.host, self.port))
+            addr = self._target()
+            packets = 0
+            
+            # Pack newline-separated lines into datagrams no larger than the MTU,
+            # writing in place into a preallocated buffer; a single oversized
+            # line still goes out on its own
+            max_size = self._max_packet_size
+            buf = self._packet_buffer()
+            with memoryview(buf) as view:
+                pos = 0
+                for line in lines:
+                    data = line.encode('utf-8')
+                    size = len(data)
+                    if pos and pos + 1 + size > max_size:
+                        sock.sendto(view[:pos], addr)
+                        packets += 1
+                        pos = 0
+                    if size > max_size:
+                        sock.sendto(data, addr)
+                        packets += 1
+                        continue
+                    if pos:
+                        buf[pos] = 0x0A  # b'\n'
+                        pos += 1
+                    buf[pos:pos + size] = data
+                    pos += size
+                if pos:
+                    sock.sendto(view[:pos], addr)
+                    packets += 1
             
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.monotonic_ns() - start_time) / 1e6
             
             return SubmitResponse(
                 success=True,
-                message=f"Batch sent via DogStatsD ({len(lines)} metrics)",
+                message=f"Batch sent via DogStatsD ({len(lines)} metrics in {packets} packets)",
                 request_id=request_id,
                 latency_ms=latency_ms,
-                response_body={"lines": lines, "count": len(lines), "host": self.host, "port": self.port}
+                response_body={
+                    "lines": lines,
+                    "count": len(lines),
+                    "packets": packets,
+                    **self._target_info
+                }
             )
             
+        except BlockingIOError:
+            return self._dropped_response(request_id, start_time)
         except socket.error as e:
             return SubmitResponse(
                 success=False,
                 message=f"Socket error: {str(e)}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
-                error_hint=f"Failed to send UDP packet to {self.host}:{self.port}. Check DD_AGENT_HOST and DOGSTATSD_PORT."
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
+                error_hint=f"Failed to send DogStatsD packet to {self._endpoint}. {self._config_hint}"
             )
         except Exception as e:
             return SubmitResponse(
                 success=False,
                 message=f"Error: {str(e)}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint=f"Unexpected error: {type(e).__name__}"
             )
     
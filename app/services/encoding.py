@@ -0,0 +1,15 @@
+import json
+from typing import Any
+import orjson
+
+
+def dumps(payload: Any) -> bytes:
+    """Serialize payload to JSON bytes with orjson, falling back to the stdlib encoder
+
+    orjson rejects strings it cannot write as UTF-8 (e.g. lone surrogates, which
+    valid JSON input such as "\\ud800" can produce); json.dumps escapes them.
+    """
+    try:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        return json.dumps(payload).encode()
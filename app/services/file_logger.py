@@ -1,10 +1,15 @@
-import json
+import os
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from app.config import settings
 from app.models import SubmitResponse, LogStatus
+from app.services.encoding import dumps
+
+
+# Block size used when reading the log file backwards for get_recent_lines
+_TAIL_BLOCK_SIZE = 64 * 1024
 
 
 class FileLogger:
@@ -22,25 +27,28 @@ class FileLogger:
             return False
     
     def write_raw(self, messages: list[str]) -> SubmitResponse:
-        start_time = time.time()
-        request_id = f"agent-file-{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        start_time = time.monotonic_ns()
+        request_id = f"agent-file-{time.time_ns():x}"
         
         if not self._directory_available:
             return SubmitResponse(
                 success=False,
                 message=f"Log directory not available: {self.log_path.parent}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint="Log directory is not writable. This feature requires Docker with shared volumes."
             )
         
         try:
+            payload = ''.join(
+                message if message.endswith('\n') else message + '\n'
+                for message in messages
+            )
+            # One write per request keeps concurrent appends from interleaving
             with open(self.log_path, 'a') as f:
-                for message in messages:
-                    line = message if message.endswith('\n') else message + '\n'
-                    f.write(line)
+                f.write(payload)
             
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.monotonic_ns() - start_time) / 1e6
             
             return SubmitResponse(
                 success=True,
@@ -58,7 +66,7 @@ class FileLogger:
                 success=False,
                 message=f"Permission denied writing to {self.log_path}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint="Check file permissions and volume mount configuration."
             )
         except Exception as e:
@@ -66,7 +74,7 @@ class FileLogger:
                 success=False,
                 message=f"Error: {str(e)}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint=f"Unexpected error: {type(e).__name__}"
             )
     
@@ -78,37 +86,41 @@ class FileLogger:
         tags: Optional[list[str]] = None,
         status: Optional[LogStatus] = None
     ) -> SubmitResponse:
-        start_time = time.time()
-        request_id = f"agent-file-json-{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        start_time = time.monotonic_ns()
+        request_id = f"agent-file-json-{time.time_ns():x}"
         
         if not self._directory_available:
             return SubmitResponse(
                 success=False,
                 message=f"Log directory not available: {self.log_path.parent}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint="Log directory is not writable. This feature requires Docker with shared volumes."
             )
         
         try:
-            with open(self.log_path, 'a') as f:
-                for message in messages:
-                    log_entry = {
-                        "message": message,
-                        "timestamp": datetime.utcnow().isoformat() + "Z"
-                    }
-                    if service:
-                        log_entry["service"] = service
-                    if source:
-                        log_entry["source"] = source
-                    if status:
-                        log_entry["status"] = status.value
-                    if tags:
-                        log_entry["ddtags"] = ",".join(tags)
-                    
-                    f.write(json.dumps(log_entry) + '\n')
+            # Every entry in a batch shares one timestamp and the same optional fields
+            timestamp = datetime.utcnow().isoformat() + "Z"
+            extra = {}
+            if service:
+                extra["service"] = service
+            if source:
+                extra["source"] = source
+            if status:
+                extra["status"] = status.value
+            if tags:
+                extra["ddtags"] = ",".join(tags)
+            
+            lines = [
+                dumps({"message": message, "timestamp": timestamp, **extra})
+                for message in messages
+            ]
             
-            latency_ms = (time.time() - start_time) * 1000
+            with open(self.log_path, 'ab') as f:
+                if lines:
+                    f.write(b'\n'.join(lines) + b'\n')
+            
+            latency_ms = (time.monotonic_ns() - start_time) / 1e6
             
             return SubmitResponse(
                 success=True,
@@ -127,7 +139,7 @@ class FileLogger:
                 success=False,
                 message=f"Permission denied writing to {self.log_path}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint="Check file permissions and volume mount configuration."
             )
         except Exception as e:
@@ -135,7 +147,7 @@ class FileLogger:
                 success=False,
                 message=f"Error: {str(e)}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint=f"Unexpected error: {type(e).__name__}"
             )
     
@@ -146,22 +158,41 @@ class FileLogger:
             if not self.log_path.exists():
                 return []
             
-            with open(self.log_path, 'r') as f:
-                lines = f.readlines()
-                return lines[-n:]
+            return self._tail(n)
         except Exception:
             return []
     
+    def _tail(self, n: int) -> list[str]:
+        """Read the last n lines by seeking backwards from the end of the file"""
+        if n <= 0:
+            return []
+        
+        with open(self.log_path, 'rb') as f:
+            end = f.seek(0, os.SEEK_END)
+            blocks = []
+            newlines = 0
+            # One extra newline is needed so the oldest returned line is complete
+            while end > 0 and newlines <= n:
+                size = min(_TAIL_BLOCK_SIZE, end)
+                end -= size
+                f.seek(end)
+                block = f.read(size)
+                blocks.append(block)
+                newlines += block.count(b'\n')
+        
+        data = b''.join(reversed(blocks))
+        return [line.decode('utf-8', 'replace') for line in data.splitlines(keepends=True)[-n:]]
+    
     def clear_log(self) -> SubmitResponse:
-        start_time = time.time()
-        request_id = f"agent-file-clear-{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        start_time = time.monotonic_ns()
+        request_id = f"agent-file-clear-{time.time_ns():x}"
         
         if not self._directory_available:
             return SubmitResponse(
                 success=False,
                 message=f"Log directory not available: {self.log_path.parent}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint="Log directory is not writable. This feature requires Docker with shared volumes."
             )
         
@@ -173,14 +204,14 @@ class FileLogger:
                 success=True,
                 message=f"Log file cleared: {self.log_path}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6
             )
         except Exception as e:
             return SubmitResponse(
                 success=False,
                 message=f"Error: {str(e)}",
                 request_id=request_id,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_time) / 1e6,
                 error_hint=f"Unexpected error: {type(e).__name__}"
             )
 
@@ -1,16 +1,47 @@
-import json
 from datetime import datetime
-from typing import Optional
-from collections import deque
-import uuid
+from typing import Any, Optional
+from collections import defaultdict, deque
+from itertools import islice
+import secrets
+from pydantic import TypeAdapter
 from app.config import settings
 from app.models import HistoryEntry, HistoryEntryType, SubmitResponse
 
 
+# Serializes the whole history in one pydantic-core pass, without intermediate dicts
+_EXPORT_ADAPTER = TypeAdapter(list[HistoryEntry])
+
+
+def _scrub(value: Any) -> Any:
+    """Escape lone surrogates, which no UTF-8 JSON encoder can write; unchanged values are returned as-is"""
+    if isinstance(value, str):
+        if value.isascii():
+            return value
+        try:
+            value.encode("utf-8")
+        except UnicodeEncodeError:
+            return value.encode("utf-8", "backslashreplace").decode("utf-8")
+        return value
+    if isinstance(value, dict):
+        items = [(_scrub(k), _scrub(v)) for k, v in value.items()]
+        if all(k is k0 and v is v0 for (k, v), (k0, v0) in zip(items, value.items())):
+            return value
+        return dict(items)
+    if isinstance(value, (list, tuple)):
+        cleaned = [_scrub(v) for v in value]
+        if all(c is v for c, v in zip(cleaned, value)):
+            return value
+        return cleaned
+    return value
+
+
 class HistoryService:
     def __init__(self, max_items: int = None):
         self.max_items = max_items or settings.max_history_items
         self._history: deque[HistoryEntry] = deque(maxlen=self.max_items)
+        # Indexes over _history, newest first; kept in step with the deque's eviction
+        self._by_id: dict[str, HistoryEntry] = {}
+        self._by_type: defaultdict[str, deque[HistoryEntry]] = defaultdict(deque)
     
     def add(
         self,
@@ -18,43 +49,74 @@ class HistoryService:
         request: dict,
         response: SubmitResponse
     ) -> HistoryEntry:
+        body = response.response_body
+        cap = settings.max_history_body_bytes
+        if cap > 0 and isinstance(body, (str, bytes)):
+            # The caller keeps the full body; only the stored copy is trimmed,
+            # by UTF-8 bytes for text so multi-byte characters count in full
+            raw = body.encode("utf-8", "surrogatepass") if isinstance(body, str) else body
+            if len(raw) > cap:
+                if isinstance(body, str):
+                    trimmed = raw[:cap].decode("utf-8", "ignore") + "...[truncated]"
+                else:
+                    trimmed = raw[:cap] + b"...[truncated]"
+                response = response.model_copy(update={"response_body": trimmed})
+        
+        # Stored entries must stay serializable for the listing and export endpoints
+        request = _scrub(request)
+        update = {
+            field: cleaned
+            for field in ("message", "response_body", "error_hint")
+            if (cleaned := _scrub(value := getattr(response, field))) is not value
+        }
+        if update:
+            response = response.model_copy(update=update)
+        
         entry = HistoryEntry(
-            id=str(uuid.uuid4())[:8],
+            id=secrets.token_hex(4),
             type=entry_type,
             timestamp=datetime.utcnow(),
             request=request,
             response=response
         )
+        if len(self._history) == self.max_items:
+            evicted = self._history[-1]
+            if self._by_id.get(evicted.id) is evicted:
+                del self._by_id[evicted.id]
+            self._by_type[evicted.type].pop()
         self._history.appendleft(entry)
+        self._by_id[entry.id] = entry
+        self._by_type[entry.type].appendleft(entry)
         return entry
     
+    @staticmethod
+    def _take(entries: deque[HistoryEntry], limit: Optional[int]) -> list[HistoryEntry]:
+        """First `limit` entries; negative limits keep list-slice semantics"""
+        if not limit:
+            return list(entries)
+        if limit < 0:
+            return list(entries)[:limit]
+        return list(islice(entries, limit))
+    
     def get_all(self, limit: Optional[int] = None) -> list[HistoryEntry]:
-        entries = list(self._history)
-        if limit:
-            return entries[:limit]
-        return entries
+        return self._take(self._history, limit)
     
     def get_by_type(self, entry_type: HistoryEntryType, limit: Optional[int] = None) -> list[HistoryEntry]:
-        entries = [e for e in self._history if e.type == entry_type]
-        if limit:
-            return entries[:limit]
-        return entries
+        entries = self._by_type.get(entry_type)
+        if not entries:
+            return []
+        return self._take(entries, limit)
     
     def get_by_id(self, entry_id: str) -> Optional[HistoryEntry]:
-        for entry in self._history:
-            if entry.id == entry_id:
-                return entry
-        return None
+        return self._by_id.get(entry_id)
     
     def clear(self):
         self._history.clear()
+        self._by_id.clear()
+        self._by_type.clear()
     
-    def export_json(self) -> str:
-        return json.dumps(
-            [entry.model_dump(mode='json') for entry in self._history],
-            indent=2,
-            default=str
-        )
+    def export_json(self) -> bytes:
+        return _EXPORT_ADAPTER.dump_json(list(self._history), indent=2, fallback=str)
 
 
 history_service = HistoryService()